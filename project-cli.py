@@ -6,20 +6,44 @@ Developer: Xeo Studio
 Stable corrected runnable version. Fixed string literal issues and other bugs that caused silent exits.
 """
 
-import json
 import os
 import sys
 import shutil
-import subprocess
-import urllib.request
-import urllib.error
+import socket
 import hashlib
 import time
+import atexit
+import threading
+import operator
+import functools
+import importlib.util
 from urllib.parse import urlparse
 from pathlib import Path
-from typing import List, Dict, Optional
-import csv
-from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
+# urllib.request (http.client, email, ssl), zipfile, tarfile, csv, subprocess, argparse and
+# concurrent.futures are imported in the functions that use them: --help, --add and the menu start
+# without paying for them
+if TYPE_CHECKING:
+    import argparse
+
+# ------------------------- JSON (orjson if installed) -------------------------
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
 
 # ------------------------- Color support (robust) -------------------------
 _COLOR_SUPPORTED = False
@@ -57,29 +81,63 @@ _COLORS = {
     'blue': '\x1b[34m',
     'white': '\x1b[37m'
 }
+# Resolved once at import: every code is '' when the terminal has no color support
+_STYLE = _COLORS if _COLOR_SUPPORTED else dict.fromkeys(_COLORS, '')
+_SRESET = _RESET if _COLOR_SUPPORTED else ''
+_SBOLD = _STYLE['bold']
+_SGREEN = _STYLE['green']
+_SRED = _STYLE['red']
+_SCYAN = _STYLE['cyan']
 
 
 def color(text: str, name: str) -> str:
-    if not _COLOR_SUPPORTED:
-        return text
-    code = _COLORS.get(name, '')
-    return f"{code}{text}{_RESET}" if code else text
+    code = _STYLE.get(name, '')
+    return code + text + _SRESET if code else text
 
 
 def style_bold(s: str) -> str:
-    return color(s, 'bold')
+    return _SBOLD + s + _SRESET
 
 
 def style_green(s: str) -> str:
-    return color(s, 'green')
+    return _SGREEN + s + _SRESET
 
 
 def style_red(s: str) -> str:
-    return color(s, 'red')
+    return _SRED + s + _SRESET
 
 
 def style_cyan(s: str) -> str:
-    return color(s, 'cyan')
+    return _SCYAN + s + _SRESET
+
+
+# constant styled messages, built once rather than on every pass through the menu loops
+_MAIN_MENU = '\n'.join(style_bold(line) for line in (
+    '1) Show & download projects',
+    '2) Manage projects (add/edit/delete/search)',
+    '3) Settings',
+    '4) Validate links now',
+    '5) Sync from central',
+    '6) Export audit log (CSV)',
+    '7) Run daemon (poll central)',
+    '0) Exit',
+))
+_MANAGE_MENU = style_bold('\nManage Projects:') + '\n1) Add\n2) Edit\n3) Delete\n4) Search\n0) Back'
+_RED_INVALID_SEL = style_red('Invalid selection.')
+_RED_ENTER_NUM = style_red('Enter a valid number.')
+_RED_INVALID_NUM = style_red('Invalid number.')
+_RED_UNKNOWN = style_red('Unknown selection.')
+_RED_UNKNOWN_OPTION = style_red('Unknown option.')
+_RED_LOCKED = style_red('This option is locked in production mode.')
+_GREEN_DOWNLOAD_OK = style_green('Download completed successfully.')
+_RED_DOWNLOAD_FAILED = style_red('Download failed.')
+
+
+def _pause(msg: str = 'Press Enter to continue...') -> None:
+    # throwaway prompt: a plain readline, no line-editing hook
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    sys.stdin.readline()
 
 
 def clear_screen() -> None:
@@ -125,6 +183,9 @@ LOG_FILE = APP_DIR / 'downloads.log'
 VALIDATION_CACHE = APP_DIR / 'validation_cache.json'
 PLUGINS_DIR = APP_DIR / 'plugins'
 PLUGINS_DIR.mkdir(parents=True, exist_ok=True)
+# plugins may import helper modules kept next to them; appended so they cannot shadow real modules
+if str(PLUGINS_DIR) not in sys.path:
+    sys.path.append(str(PLUGINS_DIR))
 
 DEFAULT_CONFIG = {
     'download_path': str(APP_DIR / 'downloads'),
@@ -136,20 +197,111 @@ DEFAULT_CONFIG = {
     'locked': False,
     'retries': 2,
     'parallel': 3,
+    'validate_parallel': 16,
     'bandwidth_limit': 0,
     'proxy': '',
     'github_token': '',
     'validate_cache_ttl': 3600,
+    'validate_negative_ttl': 300,
     'daemon_poll_interval': 300,
     'webhook_on_event': ''
 }
 
 # ------------------------- Config & Projects -------------------------
 
+def _write_atomic(path: Path, payload: bytes, fsync: bool = False) -> None:
+    """Write to a temp file and rename it over path, so readers never see a truncated file.
+
+    A symlinked path has its target replaced, and the existing file's permissions are kept
+    (config.json may hold a token and be chmod 600).
+    """
+    path = Path(os.path.realpath(path))
+    tmp = path.with_name(f'{path.name}.tmp.{os.getpid()}')
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o600  # new file: private until the user says otherwise
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    try:
+        # the temp file never exists with looser permissions than the final one, and O_EXCL
+        # refuses a file or symlink planted at the temp name
+        try:
+            fd = os.open(tmp, flags, mode)
+        except FileExistsError:
+            os.unlink(tmp)  # leftover from a crashed run with the same pid; unlink never follows links
+            fd = os.open(tmp, flags, mode)
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, mode)  # the umask may have narrowed the creation mode
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class JsonFileCache:
+    """Parsed JSON files keyed by path, reused while the file's (mtime, size) stays the same.
+
+    Callers get copies (the list, each dict in it, or the top-level dict), so mutating
+    a loaded config or project list never changes the cached value.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Path, tuple] = {}
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _copy(data):
+        if isinstance(data, list):
+            return [dict(x) if isinstance(x, dict) else x for x in data]
+        if isinstance(data, dict):
+            return dict(data)
+        return data
+
+    def _entry(self, path: Path, parse) -> tuple:
+        stamp = self._stamp(path)
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, parse(path.read_bytes()), {})
+            self._entries[path] = entry
+        return entry
+
+    def load(self, path: Path, parse):
+        return self._copy(self._entry(path, parse)[1])
+
+    def derived(self, path: Path, parse, name: str, build):
+        """Memoize build(data) next to the cached parse of path; rebuilt when the file changes. Shared: read-only."""
+        _, data, extras = self._entry(path, parse)
+        if name not in extras:
+            extras[name] = build(data)
+        return extras[name]
+
+    def store(self, path: Path, data) -> None:
+        """Record data just written to path, so the next load skips parsing it again."""
+        self._entries[path] = (self._stamp(path), self._copy(data), {})
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_LOAD_CACHE = JsonFileCache()
+
+
 def load_config() -> Dict:
     if CONFIG_PATH.exists():
         try:
-            return json.loads(CONFIG_PATH.read_text(encoding='utf-8'))
+            return _LOAD_CACHE.load(CONFIG_PATH, _json_loads)
         except Exception:
             print(style_red('Warning: failed to read config file; recreating defaults.'))
     cfg = DEFAULT_CONFIG.copy()
@@ -159,7 +311,9 @@ def load_config() -> Dict:
 
 def save_config(cfg: Dict) -> None:
     APP_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(cfg, indent=2, ensure_ascii=False), encoding='utf-8')
+    # fsync only when events are reported externally (webhook set)
+    _write_atomic(CONFIG_PATH, _json_dumps(cfg), fsync=bool(cfg.get('webhook_on_event')))
+    _LOAD_CACHE.store(CONFIG_PATH, cfg)
 
 
 def load_projects(cfg: Dict) -> List[Dict]:
@@ -170,9 +324,8 @@ def load_projects(cfg: Dict) -> List[Dict]:
             print(style_red('No remote projects URL in settings.'))
             return []
         try:
-            with urllib.request.urlopen(url, timeout=15) as r:
-                data = r.read()
-                return json.loads(data.decode('utf-8'))
+            with make_opener(cfg).open(url, timeout=15) as r:
+                return _json_loads(r.read())
         except Exception as e:
             print(style_red(f'Failed to fetch remote projects: {e}'))
             return []
@@ -182,58 +335,213 @@ def load_projects(cfg: Dict) -> List[Dict]:
             path.write_text('[]', encoding='utf-8')
             return []
         try:
-            return json.loads(path.read_text(encoding='utf-8'))
+            return _LOAD_CACHE.load(path, _json_loads)
         except Exception as e:
             print(style_red(f'Failed to read local projects file: {e}'))
             return []
 
 
+def _index_by_name(projects) -> Dict:
+    index = {}
+    for p in projects:
+        if isinstance(p, dict):
+            index.setdefault(p.get('name'), p)  # first project wins, as a linear scan would
+    return index
+
+
+def _search_index(projects) -> List[Tuple[int, Dict, str, str]]:
+    # (number, project, lower-cased name, lower-cased tags joined by NUL) so a query is two substring tests
+    return [(idx, p, (p.get('name') or '').lower(), '\0'.join(t.lower() for t in p.get('tags', []) if isinstance(t, str)))
+            for idx, p in enumerate(projects, start=1) if isinstance(p, dict)]
+
+
+def _projects_derived(cfg: Dict, name: str, build):
+    """build(projects), cached with the parsed local projects file; rebuilt per call for remote sources."""
+    if cfg.get('source', 'local') != 'remote':
+        path = Path(cfg.get('projects_file', str(DEFAULT_PROJECTS_FILE)))
+        try:
+            return _LOAD_CACHE.derived(path, _json_loads, name, build)
+        except Exception:
+            pass  # missing or unreadable file: load_projects below reports it as usual
+    return build(load_projects(cfg))
+
+
+def find_project_by_name(cfg: Dict, name: str) -> Optional[Dict]:
+    project = _projects_derived(cfg, 'by_name', _index_by_name).get(name)
+    return dict(project) if project is not None else None
+
+
 def save_local_projects(cfg: Dict, projects: List[Dict]) -> None:
     path = Path(cfg.get('projects_file', str(DEFAULT_PROJECTS_FILE)))
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(projects, indent=2, ensure_ascii=False), encoding='utf-8')
+    _write_atomic(path, _json_dumps(projects), fsync=bool(cfg.get('webhook_on_event')))
+    _LOAD_CACHE.store(path, projects)
 
 # ------------------------- Validation cache -------------------------
+# The cache ({url: {'ok', 'type', 'reason', 'ts'}}) is parsed once per process and only
+# re-read when the file changes on disk. record_probe marks it dirty; save_validation_cache
+# rewrites the file only when something changed (and runs again at exit).
+_VCACHE: Optional[Dict] = None
+_VCACHE_MTIME: Optional[int] = None
+_VCACHE_DIRTY = False
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def load_validation_cache() -> Dict:
-    if VALIDATION_CACHE.exists():
+    global _VCACHE, _VCACHE_MTIME, _VCACHE_DIRTY
+    mtime = _mtime_ns(VALIDATION_CACHE)
+    if _VCACHE is not None and (_VCACHE_DIRTY or mtime == _VCACHE_MTIME):
+        return _VCACHE
+    cache = {}
+    if mtime is not None:
         try:
-            return json.loads(VALIDATION_CACHE.read_text(encoding='utf-8'))
+            cache = _json_loads(VALIDATION_CACHE.read_bytes())
         except Exception:
-            return {}
-    return {}
+            cache = {}
+    _VCACHE, _VCACHE_MTIME, _VCACHE_DIRTY = cache, mtime, False
+    return cache
+
+
+def is_cache_fresh(entry: Optional[Dict], cfg: Dict, now: float) -> bool:
+    """Failed probes expire after validate_negative_ttl so fixed links show up quickly."""
+    if not entry:
+        return False
+    ttl = cfg.get('validate_cache_ttl', 3600)
+    if not entry.get('ok'):
+        ttl = min(ttl, cfg.get('validate_negative_ttl', 300))
+    return now - entry.get('ts', 0) < ttl
+
+
+def record_probe(cache: Dict, url: str, probe: Dict) -> None:
+    global _VCACHE_DIRTY
+    cache[url] = {'ok': probe.get('ok'), 'type': probe.get('type'), 'reason': probe.get('reason'), 'ts': time.time()}
+    _VCACHE_DIRTY = True
+
+
+def prune_validation_cache(cache: Dict, cfg: Dict, now: Optional[float] = None, keep=()) -> None:
+    """Drop entries older than validate_cache_ttl; they can never be served again.
+
+    Pass the now used for the freshness checks so nothing they counted as fresh is dropped,
+    and the URLs just probed in keep so they survive even with a TTL of 0.
+    """
+    global _VCACHE_DIRTY
+    cutoff = (time.time() if now is None else now) - cfg.get('validate_cache_ttl', 3600)
+    expired = [url for url, entry in cache.items() if entry.get('ts', 0) <= cutoff and url not in keep]
+    for url in expired:
+        del cache[url]
+    if expired:
+        _VCACHE_DIRTY = True
+
 
+def save_validation_cache(cache: Optional[Dict] = None) -> None:
+    global _VCACHE, _VCACHE_MTIME, _VCACHE_DIRTY
+    if cache is not None and cache is not _VCACHE:
+        _VCACHE, _VCACHE_DIRTY = cache, True
+    if _VCACHE is None or not _VCACHE_DIRTY:
+        return
+    try:
+        _write_atomic(VALIDATION_CACHE, _json_dumps(_VCACHE))
+    except Exception:
+        return
+    _VCACHE_MTIME, _VCACHE_DIRTY = _mtime_ns(VALIDATION_CACHE), False
 
-def save_validation_cache(cache: Dict) -> None:
-    VALIDATION_CACHE.write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding='utf-8')
+
+atexit.register(save_validation_cache)
 
 # ------------------------- Logging -------------------------
 
+# The log file stays open for the whole session; records are buffered and flushed
+# every LOG_FLUSH_EVERY records or LOG_FLUSH_INTERVAL seconds, and at exit. A timer
+# enforces the interval even when no further record arrives after a burst.
+LOG_FLUSH_EVERY = 64
+LOG_FLUSH_INTERVAL = 0.5
+_LOG_LOCK = threading.Lock()
+_LOG_FH = None
+_LOG_PENDING = 0
+_LOG_LAST_FLUSH = 0.0
+_LOG_TIMER = None
+
+
+def _flush_log_locked() -> None:
+    global _LOG_PENDING, _LOG_LAST_FLUSH
+    if _LOG_FH is not None:
+        _LOG_FH.flush()
+    _LOG_PENDING = 0
+    _LOG_LAST_FLUSH = time.monotonic()
+
+
+def flush_log() -> None:
+    with _LOG_LOCK:
+        try:
+            _flush_log_locked()
+        except Exception:
+            pass
+
+
+def _timed_flush_log() -> None:
+    global _LOG_TIMER
+    with _LOG_LOCK:
+        _LOG_TIMER = None
+        try:
+            if _LOG_PENDING:
+                _flush_log_locked()
+        except Exception:
+            pass
+
+
 def log_download(entry: Dict) -> None:
-    APP_DIR.mkdir(parents=True, exist_ok=True)
+    global _LOG_FH, _LOG_PENDING, _LOG_TIMER
     timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     record = {'timestamp': timestamp, **entry}
+    line = _json_dumps(record, indent=False) + b'\n'
     try:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        with _LOG_LOCK:
+            if _LOG_FH is None:
+                APP_DIR.mkdir(parents=True, exist_ok=True)
+                _LOG_FH = open(LOG_FILE, 'ab', buffering=1 << 16)
+                atexit.register(flush_log)
+            _LOG_FH.write(line)
+            _LOG_PENDING += 1
+            if _LOG_PENDING >= LOG_FLUSH_EVERY or time.monotonic() - _LOG_LAST_FLUSH >= LOG_FLUSH_INTERVAL:
+                _flush_log_locked()
+            elif _LOG_TIMER is None:
+                _LOG_TIMER = threading.Timer(LOG_FLUSH_INTERVAL, _timed_flush_log)
+                _LOG_TIMER.daemon = True
+                _LOG_TIMER.start()
     except Exception:
         pass
 
 
+AUDIT_FIELDS = ('timestamp', 'project', 'url', 'result', 'path', 'info')
+_AUDIT_BLANK = dict.fromkeys(AUDIT_FIELDS, '')
+_audit_row = operator.itemgetter(*AUDIT_FIELDS)
+
+
+def _audit_rows(lines):
+    for line in lines:
+        try:
+            yield _audit_row({**_AUDIT_BLANK, **_json_loads(line)})
+        except Exception:
+            continue  # skip torn or non-JSON lines
+
+
 def export_audit_csv(outpath: Path) -> None:
+    import csv
+    flush_log()
     if not LOG_FILE.exists():
         print(style_red('No log to export.'))
         return
     try:
-        with open(LOG_FILE, 'r', encoding='utf-8') as r, open(outpath, 'w', encoding='utf-8', newline='') as w:
+        with open(LOG_FILE, 'rb') as r, open(outpath, 'w', encoding='utf-8', newline='', buffering=1 << 20) as w:
             writer = csv.writer(w)
-            writer.writerow(['timestamp', 'project', 'url', 'result', 'path', 'info'])
-            for line in r:
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    continue
-                writer.writerow([obj.get('timestamp'), obj.get('project'), obj.get('url'), obj.get('result'), obj.get('path'), obj.get('info', '')])
+            writer.writerow(AUDIT_FIELDS)
+            writer.writerows(_audit_rows(r))
         print(style_green(f'Exported audit log to {outpath}'))
     except Exception as e:
         print(style_red(f'Export failed: {e}'))
@@ -241,23 +549,73 @@ def export_audit_csv(outpath: Path) -> None:
 # ------------------------- Helpers: checksums, extraction, file type -------------------------
 
 def sha256_of_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+: read/update loop runs in C
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
             h.update(chunk)
     return h.hexdigest()
 
 
+_ARCHIVE_SUFFIXES = frozenset({'.zip', '.tar', '.tgz'})
+_ARCHIVE_DOUBLE_SUFFIXES = frozenset({('.tar', '.gz'), ('.tar', '.bz2'), ('.tar', '.xz')})
+
+
 def is_archive_file(path: Path) -> bool:
-    return str(path).lower().endswith(('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2'))
+    if path.suffix.lower() in _ARCHIVE_SUFFIXES:
+        return True
+    return tuple(s.lower() for s in path.suffixes[-2:]) in _ARCHIVE_DOUBLE_SUFFIXES
+
+
+EXTRACT_BUFFER = 1 << 20
+# streaming (single pass, no seeking) tarfile modes by final suffix; is_archive_file vets the rest
+_TAR_STREAM_MODES = {'.tar': 'r|', '.tgz': 'r|gz', '.gz': 'r|gz', '.bz2': 'r|bz2', '.xz': 'r|xz'}
+
+
+def _extract_zip(path: Path, dest_folder: Path) -> None:
+    import zipfile
+    made = set()
+    with zipfile.ZipFile(path) as z:
+        for zi in z.infolist():
+            name = zi.filename
+            # same rule as shutil.unpack_archive: skip absolute paths and parent references
+            if name.startswith('/') or '..' in name:
+                continue
+            target = dest_folder.joinpath(*name.split('/'))
+            if zi.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            if target.parent not in made:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                made.add(target.parent)
+            with z.open(zi) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_BUFFER)
+
+
+def _extract_tar(path: Path, dest_folder: Path, mode: str) -> None:
+    import tarfile
+    with open(path, 'rb', buffering=EXTRACT_BUFFER) as f, tarfile.open(fileobj=f, mode=mode) as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(dest_folder, filter='data')
+        else:
+            tar.extractall(dest_folder)
 
 
 def extract_archive(path: Path, dest_folder: Path) -> bool:
+    import tarfile
+    import zipfile
     try:
         dest_folder.mkdir(parents=True, exist_ok=True)
-        shutil.unpack_archive(str(path), extract_dir=str(dest_folder))
+        suffix = path.suffix.lower()
+        if suffix == '.zip':
+            _extract_zip(path, dest_folder)
+        elif suffix in _TAR_STREAM_MODES and is_archive_file(path):
+            _extract_tar(path, dest_folder, _TAR_STREAM_MODES[suffix])
+        else:
+            shutil.unpack_archive(str(path), extract_dir=str(dest_folder))
         return True
-    except shutil.ReadError:
+    except (shutil.ReadError, zipfile.BadZipFile, tarfile.TarError):
         print(style_red('Not a supported archive or archive is corrupted.'))
     except Exception as e:
         print(style_red(f'Extraction failed: {e}'))
@@ -265,28 +623,40 @@ def extract_archive(path: Path, dest_folder: Path) -> bool:
 
 # ------------------------- Plugin loader (simple) -------------------------
 
-def load_plugins() -> List:
-    sys.path.insert(0, str(PLUGINS_DIR))
+@functools.lru_cache(maxsize=1)
+def load_plugins() -> Tuple[ModuleType, ...]:
+    """Load plugins once per session. Modules are executed from their files and not added to sys.modules."""
     plugins = []
-    for p in PLUGINS_DIR.glob('*.py'):
-        name = p.stem
+    for p in sorted(PLUGINS_DIR.glob('*.py')):
         try:
-            mod = __import__(name)
-            if hasattr(mod, 'fetch'):
-                plugins.append(mod)
+            spec = importlib.util.spec_from_file_location(f'project_downloader_plugin_{p.stem}', p)
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
         except Exception:
             continue
-    return plugins
+        if hasattr(mod, 'fetch'):
+            plugins.append(mod)
+    return tuple(plugins)
 
 # ------------------------- Network helpers & validation -------------------------
 
-def make_opener(cfg: Dict):
+@functools.lru_cache(maxsize=1024)
+def _parsed(url: str):
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    return _parsed(url).netloc.lower()
+
+
+@functools.lru_cache(maxsize=4)
+def _opener_for(proxy: str, token: str):
+    import urllib.request
     handlers = []
-    proxy = cfg.get('proxy')
     if proxy:
         handlers.append(urllib.request.ProxyHandler({'http': proxy, 'https': proxy}))
     opener = urllib.request.build_opener(*handlers)
-    token = cfg.get('github_token')
     if token:
         opener.addheaders = [('User-Agent', 'ProjectDownloader/1.0'), ('Authorization', f'token {token}')]
     else:
@@ -294,8 +664,19 @@ def make_opener(cfg: Dict):
     return opener
 
 
-def probe_url(opener, url: str, timeout: int = 10) -> Dict:
+def make_opener(cfg: Dict):
+    """Return the shared opener for the configured proxy/token (built once per combination)."""
+    return _opener_for(cfg.get('proxy') or '', cfg.get('github_token') or '')
+
+
+# network-level failures where retrying the probe as a GET cannot help
+_UNREACHABLE_ERRORS = (socket.gaierror, socket.timeout, TimeoutError, ConnectionRefusedError)
+
+
+def probe_url(opener, url: str, timeout: int = 7) -> Dict:
     """Return dict: {'ok': bool, 'type': 'github'|'file'|'unknown', 'code': int or None, 'reason': str}"""
+    import urllib.error
+    import urllib.request
     try:
         req = urllib.request.Request(url, method='HEAD')
         with opener.open(req, timeout=timeout) as r:
@@ -303,15 +684,17 @@ def probe_url(opener, url: str, timeout: int = 10) -> Dict:
             code = getattr(r, 'status', None) or getattr(r, 'getcode', lambda: None)()
             cdisp = headers.get('Content-Disposition')
             ctype = headers.get('Content-Type', '')
-            netloc = urlparse(url).netloc.lower()
-            if 'github.com' in netloc and not url.rstrip().endswith(('.zip', '.tar.gz')):
+            if 'github.com' in _netloc(url) and not url.rstrip().endswith(('.zip', '.tar.gz')):
                 return {'ok': True, 'type': 'github', 'code': code, 'reason': 'GitHub repo (HEAD ok)'}
             if cdisp or ctype.startswith(('application/', 'binary/', 'application/octet-stream', 'application/zip')):
                 return {'ok': True, 'type': 'file', 'code': code, 'reason': f'Content-Type: {ctype}'}
             return {'ok': True, 'type': 'unknown', 'code': code, 'reason': f'Content-Type: {ctype}'}
     except urllib.error.HTTPError as e:
         return {'ok': False, 'type': 'error', 'code': e.code, 'reason': str(e)}
-    except Exception:
+    except Exception as e:
+        # URLError wraps the socket error in .reason; unreachable hosts and malformed URLs fail fast
+        if isinstance(e, ValueError) or isinstance(getattr(e, 'reason', e), _UNREACHABLE_ERRORS):
+            return {'ok': False, 'type': 'error', 'code': None, 'reason': str(e)}
         try:
             req = urllib.request.Request(url, method='GET')
             with opener.open(req, timeout=timeout) as r:
@@ -324,16 +707,28 @@ def probe_url(opener, url: str, timeout: int = 10) -> Dict:
         except Exception as e2:
             return {'ok': False, 'type': 'error', 'code': None, 'reason': str(e2)}
 
+
+def probe_urls(opener, urls: List[str], cfg: Dict) -> Dict[str, Dict]:
+    """Probe several URLs concurrently (up to cfg['validate_parallel'] at once). Returns {url: probe result}."""
+    from concurrent.futures import ThreadPoolExecutor
+    if not urls:
+        return {}
+    # probes are cheap HEADs, so they get their own (wider) limit than downloads
+    workers = max(1, min(cfg.get('validate_parallel', 16), len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(lambda u: (u, probe_url(opener, u)), urls))
+
 # ------------------------- Download logic (with resume, throttling, hooks) -------------------------
 
 def is_git_url(url: str) -> bool:
     try:
-        return 'github.com' in urlparse(url).netloc and (url.strip().endswith('.git') or ('/blob/' not in url and '/releases/' not in url))
+        return 'github.com' in _netloc(url) and (url.strip().endswith('.git') or ('/blob/' not in url and '/releases/' not in url))
     except Exception:
         return False
 
 
 def run_git_clone(url: str, dest: Path, cfg: Dict) -> bool:
+    import subprocess
     try:
         print(f'Running git clone {url} -> {dest}')
         env = os.environ.copy()
@@ -355,12 +750,85 @@ def run_git_clone(url: str, dest: Path, cfg: Dict) -> bool:
         return False
 
 
-def download_http(url: str, dest: Path, cfg: Dict, opener=None, resume=True) -> bool:
+DOWNLOAD_BUFFER = 1 << 20
+
+
+def _throttle(bandwidth_limit: int):
+    """Token bucket: the returned hook only sleeps once the allowance for the elapsed time is used up."""
+    tokens = float(bandwidth_limit)
+    last_refill = time.monotonic()
+
+    def on_chunk(n: int) -> None:
+        nonlocal tokens, last_refill
+        now = time.monotonic()
+        tokens = min(bandwidth_limit, tokens + (now - last_refill) * bandwidth_limit) - n
+        last_refill = now
+        if tokens < 0:
+            time.sleep(-tokens / bandwidth_limit)
+            tokens = 0.0
+            last_refill = time.monotonic()
+    return on_chunk
+
+
+def _progress(total: int, downloaded: int):
+    last_print = 0.0
+
+    def on_chunk(n: int) -> None:
+        nonlocal downloaded, last_print
+        downloaded += n
+        now = time.time()
+        if now - last_print > 0.5:
+            percent = downloaded * 100 // total
+            # carriage return without breaking string literals
+            print(f"Downloading... {percent}% ({downloaded}/{total} bytes)", end='\r')
+            last_print = now
+    return on_chunk
+
+
+def _copy_loop(resp, write, buf: memoryview, throttle=None, progress=None) -> None:
+    """Copy resp into write() through buf, using a loop with only the per-chunk hooks that are enabled."""
+    if throttle is None and progress is None:
+        while True:
+            n = resp.readinto(buf)
+            if not n:
+                return
+            write(buf[:n])
+    elif progress is None:
+        while True:
+            n = resp.readinto(buf)
+            if not n:
+                return
+            write(buf[:n])
+            throttle(n)
+    elif throttle is None:
+        while True:
+            n = resp.readinto(buf)
+            if not n:
+                return
+            write(buf[:n])
+            progress(n)
+    else:
+        while True:
+            n = resp.readinto(buf)
+            if not n:
+                return
+            write(buf[:n])
+            throttle(n)
+            progress(n)
+
+
+def download_http(url: str, dest: Path, cfg: Dict, opener=None, resume=True, hasher=None) -> bool:
+    import urllib.request
+    # hasher (e.g. hashlib.sha256()) is fed every byte of dest as it is written
     if opener is None:
         opener = make_opener(cfg)
     attempt = 0
     retries = cfg.get('retries', 2)
     bandwidth_limit = cfg.get('bandwidth_limit', 0)
+    throttled = bool(bandwidth_limit and bandwidth_limit > 0)
+    # throttled reads stay small so pacing remains smooth
+    chunk_size = (1 << 16) if throttled else DOWNLOAD_BUFFER
+    hashed = 0
     while attempt <= retries:
         try:
             headers = {}
@@ -370,6 +838,13 @@ def download_http(url: str, dest: Path, cfg: Dict, opener=None, resume=True) ->
             if resume and existing_size > 0:
                 headers['Range'] = f'bytes={existing_size}-'
                 mode = 'ab'
+                if hasher is not None and hashed < existing_size:
+                    # bring the running hash up to the bytes already on disk
+                    with open(dest, 'rb') as f:
+                        f.seek(hashed)
+                        for chunk in iter(lambda: f.read(1 << 20), b''):
+                            hasher.update(chunk)
+                    hashed = existing_size
             req = urllib.request.Request(url, headers=headers)
             with opener.open(req, timeout=30) as resp:
                 total = resp.getheader('Content-Length')
@@ -378,28 +853,22 @@ def download_http(url: str, dest: Path, cfg: Dict, opener=None, resume=True) ->
                         total = int(total) + (existing_size if 'Range' in headers else 0)
                     except Exception:
                         total = None
-                chunk_size = 8192
                 dest.parent.mkdir(parents=True, exist_ok=True)
                 with open(dest, mode) as f:
-                    downloaded = existing_size
-                    last_print = 0
-                    while True:
-                        chunk = resp.read(chunk_size)
-                        if not chunk:
-                            break
+                    if not throttled and not total and hasher is None:
+                        # nothing to do per chunk: let shutil run the copy loop
+                        shutil.copyfileobj(resp, f, DOWNLOAD_BUFFER)
+                        return True
+
+                    def hashing_write(chunk) -> None:
+                        nonlocal hashed
                         f.write(chunk)
-                        downloaded += len(chunk)
-                        if bandwidth_limit and bandwidth_limit > 0:
-                            sleep_time = len(chunk) / float(bandwidth_limit)
-                            if sleep_time > 0:
-                                time.sleep(sleep_time)
-                        if total:
-                            now = time.time()
-                            if now - last_print > 0.5:
-                                percent = downloaded * 100 // total
-                                # carriage return without breaking string literals
-                                print(f"Downloading... {percent}% ({downloaded}/{total} bytes)", end='\r')
-                                last_print = now
+                        hasher.update(chunk)
+                        hashed += len(chunk)
+
+                    _copy_loop(resp, f.write if hasher is None else hashing_write, memoryview(bytearray(chunk_size)),
+                               throttle=_throttle(bandwidth_limit) if throttled else None,
+                               progress=_progress(total, existing_size) if total else None)
                 if total:
                     print()
             return True
@@ -412,21 +881,55 @@ def download_http(url: str, dest: Path, cfg: Dict, opener=None, resume=True) ->
     return False
 
 
+class _SafeNameTable(dict):
+    """str.translate table keeping alphanumerics, space, '-' and '_'; filled in per character on first use."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        ch = chr(code)
+        value = code if ch.isalnum() or ch in ' -_' else None
+        self[code] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
 def prepare_target_for_download(name: str, download_root: Path, url: str) -> Path:
-    safe_name = ''.join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    parsed = urlparse(url)
-    filename = os.path.basename(parsed.path) or (safe_name + '.download')
+    """Pick a free file name and reserve it by creating it empty, so concurrent downloads never share a target."""
+    safe_name = name.translate(_SAFE_NAME_TABLE).rstrip()
+    filename = os.path.basename(_parsed(url).path) or (safe_name + '.download')
     folder = download_root / safe_name
     folder.mkdir(parents=True, exist_ok=True)
-    dest = folder / filename
-    i = 1
-    while dest.exists():
-        dest = folder / (dest.stem + f'_{i}' + dest.suffix)
+    existing = {p.name for p in folder.iterdir()}
+    base = Path(filename)
+    candidate, i = filename, 0
+    while True:
+        if candidate not in existing:
+            try:
+                with open(folder / candidate, 'xb'):
+                    return folder / candidate
+            except FileExistsError:
+                pass  # taken since the listing, e.g. by another worker
         i += 1
-    return dest
+        candidate = f'{base.stem}_{i}{base.suffix}'
+
+
+def prepare_target_for_clone(name: str, download_root: Path) -> Path:
+    """Reserve an empty directory to clone into (git accepts an empty existing target)."""
+    candidate, i = download_root / name, 0
+    while True:
+        # names like 'owner/repo' nest: make the parents, but claim the leaf atomically
+        candidate.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            candidate.mkdir()
+            return candidate
+        except FileExistsError:
+            i += 1
+            candidate = download_root / (f'{name}_new' if i == 1 else f'{name}_new_{i}')
 
 
 def run_hooks(project: Dict, stage: str) -> bool:
+    import subprocess
     cmd = project.get(f'{stage}_hook')
     if not cmd:
         return True
@@ -439,14 +942,16 @@ def run_hooks(project: Dict, stage: str) -> bool:
         return False
 
 
-def notify_webhook(cfg: Dict, payload: Dict) -> bool:
+def notify_webhook(cfg: Dict, payload: Dict, opener=None) -> bool:
+    import urllib.request
     url = cfg.get('webhook_on_event')
     if not url:
         return False
     try:
-        data = json.dumps(payload).encode('utf-8')
+        data = _json_dumps(payload, indent=False)
         req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'}, method='POST')
-        opener = make_opener(cfg)
+        if opener is None:
+            opener = make_opener(cfg)
         with opener.open(req, timeout=10) as r:
             return True
     except Exception:
@@ -473,7 +978,7 @@ def download_project_item(project: Dict, cfg: Dict, custom_path: Optional[str] =
     if not probe.get('ok'):
         print(style_red(f"URL not valid: {probe.get('reason')}"))
         log_download({'project': name, 'url': url, 'result': 'invalid_url', 'path': '', 'info': probe.get('reason')})
-        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'invalid_url', 'info': probe.get('reason')})
+        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'invalid_url', 'info': probe.get('reason')}, opener)
         return False
 
     if dry_run:
@@ -481,30 +986,42 @@ def download_project_item(project: Dict, cfg: Dict, custom_path: Optional[str] =
         return True
 
     if probe.get('type') == 'github' or is_git_url(url):
-        target = download_root / name
-        if target.exists():
-            target = Path(str(target) + '_new')
+        target = prepare_target_for_clone(name, download_root)
         ok = run_git_clone(url, target, cfg)
+        if not ok:
+            try:
+                target.rmdir()  # drop the reservation; left alone if git wrote anything
+            except OSError:
+                pass
         log_download({'project': name, 'url': url, 'result': 'git_clone' if ok else 'git_failed', 'path': str(target)})
-        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'git_clone' if ok else 'git_failed', 'path': str(target)})
+        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'git_clone' if ok else 'git_failed', 'path': str(target)}, opener)
         if ok:
             run_hooks(project, 'post')
         return ok
     else:
         dest = prepare_target_for_download(name, download_root, url)
-        ok = download_http(url, dest, cfg, opener=opener, resume=True)
+        hasher = hashlib.sha256() if expected_sha256 else None
+        ok = download_http(url, dest, cfg, opener=opener, resume=True, hasher=hasher)
         if not ok:
+            try:
+                if dest.stat().st_size == 0:
+                    dest.unlink()  # nothing arrived: drop the reserved empty file
+            except OSError:
+                pass
             log_download({'project': name, 'url': url, 'result': 'download_failed', 'path': str(dest)})
-            notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_failed'})
+            notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_failed'}, opener)
             return False
         if expected_sha256:
-            actual = sha256_of_file(dest)
+            actual = hasher.hexdigest()
+            if actual.lower() != expected_sha256.lower():
+                # confirm from disk: a restarted (non-resumed) attempt leaves the streamed hash stale
+                actual = sha256_of_file(dest)
             if actual.lower() != expected_sha256.lower():
                 print(style_red('Checksum mismatch!'))
                 print(style_red(f'Expected: {expected_sha256}'))
                 print(style_red(f'Actual:   {actual}'))
                 log_download({'project': name, 'url': url, 'result': 'checksum_mismatch', 'path': str(dest)})
-                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'checksum_mismatch'})
+                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'checksum_mismatch'}, opener)
                 return False
             else:
                 print(style_green('Checksum OK.'))
@@ -514,18 +1031,41 @@ def download_project_item(project: Dict, cfg: Dict, custom_path: Optional[str] =
             if ok2:
                 print(style_green(f'Extracted to {extracted_to}'))
                 log_download({'project': name, 'url': url, 'result': 'download_and_extracted', 'path': str(extracted_to)})
-                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_and_extracted', 'path': str(extracted_to)})
+                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_and_extracted', 'path': str(extracted_to)}, opener)
             else:
                 log_download({'project': name, 'url': url, 'result': 'download_but_extract_failed', 'path': str(dest)})
-                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_but_extract_failed', 'path': str(dest)})
+                notify_webhook(cfg, {'project': name, 'url': url, 'result': 'download_but_extract_failed', 'path': str(dest)}, opener)
             run_hooks(project, 'post')
             return ok2
         print(style_green(f'Download saved to {dest}'))
         log_download({'project': name, 'url': url, 'result': 'downloaded', 'path': str(dest)})
-        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'downloaded', 'path': str(dest)})
+        notify_webhook(cfg, {'project': name, 'url': url, 'result': 'downloaded', 'path': str(dest)}, opener)
         run_hooks(project, 'post')
         return True
 
+
+def download_projects(projects: List[Dict], cfg: Dict, custom_path: Optional[str] = None, dry_run: bool = False) -> List[bool]:
+    """Download several projects concurrently (up to cfg['parallel'] at once). Results follow input order."""
+    from concurrent.futures import ThreadPoolExecutor
+    if not projects:
+        return []
+    workers = max(1, min(cfg.get('parallel', 3), len(projects)))
+    worker_cfg = cfg
+    limit = cfg.get('bandwidth_limit', 0)
+    if workers > 1 and limit and limit > 0:
+        # split the bandwidth limit between workers so the total stays bounded
+        worker_cfg = dict(cfg, bandwidth_limit=max(1, limit // workers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(download_project_item, p, worker_cfg, custom_path, dry_run) for p in projects]
+        results = []
+        for p, fut in zip(projects, futures):
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                print(style_red(f"Download of {p.get('name') or 'project'} failed: {e}"))
+                results.append(False)
+        return results
+
 # ------------------------- Management: add / edit / delete / search -------------------------
 
 def print_projects(projects: List[Dict], cfg: Dict) -> None:
@@ -533,29 +1073,30 @@ def print_projects(projects: List[Dict], cfg: Dict) -> None:
         print('No projects available.')
         return
     cache = load_validation_cache()
-    ttl = cfg.get('validate_cache_ttl', 3600)
-    opener = make_opener(cfg)
-    print('\nProjects list:')
+    now = time.time()
+    # probe every uncached/expired URL up front so the network round-trips overlap
+    stale = {u for u in dict.fromkeys(p.get('url') or '' for p in projects)
+             if not is_cache_fresh(cache.get(u), cfg, now)}
+    if stale:
+        for url, probe in probe_urls(make_opener(cfg), list(stale), cfg).items():
+            record_probe(cache, url, probe)
+        prune_validation_cache(cache, cfg, now, keep=stale)
+        save_validation_cache()
+    lines = ['\nProjects list:']
     for idx, p in enumerate(projects, start=1):
         name = p.get('name') or 'unnamed'
         url = p.get('url') or ''
         note = ''
         if p.get('sha256'):
             note = ' [sha256]'
-        cached = cache.get(url)
-        status = '[Unknown]'
-        ttype = '[Unknown]'
-        if cached and (time.time() - cached.get('ts', 0) < ttl):
-            status = '[OK]' if cached.get('ok') else '[INVALID]'
-            ttype = f"[{cached.get('type').upper()}]"
-        else:
-            probe = probe_url(opener, url)
-            cache[url] = {'ok': probe.get('ok'), 'type': probe.get('type'), 'reason': probe.get('reason'), 'ts': time.time()}
-            status = '[OK]' if probe.get('ok') else '[INVALID]'
-            ttype = f"[{probe.get('type').upper()}]"
+        cached = cache.get(url) or {}
+        status = '[OK]' if cached.get('ok') else '[INVALID]'
+        ttype = f"[{(cached.get('type') or 'unknown').upper()}]"
         color_status = status if status == '[OK]' else style_red(status)
-        print(f"{idx}. {name}{note} {ttype} {color_status}\n    -> {url}")
-    save_validation_cache(cache)
+        lines.append(f"{idx}. {name}{note} {ttype} {color_status}\n    -> {url}")
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+    sys.stdout.flush()
 
 
 def add_project(cfg: Dict) -> None:
@@ -597,10 +1138,10 @@ def edit_project(cfg: Dict) -> None:
     try:
         idx = int(sel) - 1
         if idx < 0 or idx >= len(projects):
-            print(style_red('Invalid selection.'))
+            print(_RED_INVALID_SEL)
             return
     except ValueError:
-        print(style_red('Enter a valid number.'))
+        print(_RED_ENTER_NUM)
         return
     p = projects[idx]
     print(f"Current name: {p.get('name')}")
@@ -639,10 +1180,10 @@ def delete_project(cfg: Dict) -> None:
     try:
         idx = int(sel) - 1
         if idx < 0 or idx >= len(projects):
-            print(style_red('Invalid selection.'))
+            print(_RED_INVALID_SEL)
             return
     except ValueError:
-        print(style_red('Enter a valid number.'))
+        print(_RED_ENTER_NUM)
         return
     confirm = input('Type YES to confirm deletion: ').strip()
     if confirm != 'YES':
@@ -654,39 +1195,37 @@ def delete_project(cfg: Dict) -> None:
 
 
 def search_projects(cfg: Dict) -> None:
-    projects = load_projects(cfg)
+    index = _projects_derived(cfg, 'search', _search_index)
     q = input('Search query (name/tag): ').strip().lower()
-    results = []
-    for idx, p in enumerate(projects, start=1):
-        if q in (p.get('name') or '').lower() or any(q in t.lower() for t in p.get('tags', [])):
-            results.append((idx, p))
-    if not results:
-        print('No matches.')
-        return
-    for idx, p in results:
-        print(f"{idx}. {p.get('name')} -> {p.get('url')}")
+    # the query is a literal substring, not a pattern
+    lines = [f"{idx}. {p.get('name')} -> {p.get('url')}" for idx, p, name, tags in index if q in name or q in tags]
+    print('\n'.join(lines) if lines else 'No matches.')
 
 # ------------------------- Validation utilities -------------------------
 
 
 def validate_all_links(cfg: Dict, detailed: bool = False) -> List:
     projects = load_projects(cfg)
-    opener = make_opener(cfg)
     cache = load_validation_cache()
+    urls = [u for u in dict.fromkeys(p.get('url') for p in projects) if u]
+    probes = probe_urls(make_opener(cfg), urls, cfg)
+    for url, probe in probes.items():
+        record_probe(cache, url, probe)
     report = []
     for p in projects:
         url = p.get('url')
         if not url:
             report.append((p.get('name'), url, False, 'no url'))
             continue
-        probe = probe_url(opener, url)
-        cache[url] = {'ok': probe.get('ok'), 'type': probe.get('type'), 'reason': probe.get('reason'), 'ts': time.time()}
+        probe = probes[url]
         report.append((p.get('name'), url, probe.get('ok'), probe.get('reason')))
-    save_validation_cache(cache)
-    if detailed:
-        for r in report:
-            name, url, ok, reason = r
-            print(f"{name} -> {url} : {'OK' if ok else 'INVALID'} ({reason})")
+    prune_validation_cache(cache, cfg, keep=probes)
+    save_validation_cache()
+    if detailed and report:
+        lines = [f"{name} -> {url} : {'OK' if ok else 'INVALID'} ({reason})" for name, url, ok, reason in report]
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
     return report
 
 # ------------------------- Daemon (basic scheduler) -------------------------
@@ -698,7 +1237,7 @@ def run_daemon(cfg: Dict) -> None:
         while True:
             if cfg.get('central_url'):
                 try:
-                    sync_from_central(cfg)
+                    sync_from_central(cfg, conditional=True)
                 except Exception as e:
                     print(style_red(f'Central sync failed in daemon: {e}'))
             time.sleep(interval)
@@ -712,35 +1251,28 @@ def interactive_menu() -> None:
     while True:
         clear_screen()
         print_header()
-        print(style_bold('1) Show & download projects'))
-        print(style_bold('2) Manage projects (add/edit/delete/search)'))
-        print(style_bold('3) Settings'))
-        print(style_bold('4) Validate links now'))
-        print(style_bold('5) Sync from central'))
-        print(style_bold('6) Export audit log (CSV)'))
-        print(style_bold('7) Run daemon (poll central)'))
-        print(style_bold('0) Exit'))
+        print(_MAIN_MENU)
         choice = input('\nChoose a number: ').strip()
         if choice == '1':
             projects = load_projects(cfg)
             print_projects(projects, cfg)
             if not projects:
-                input('Press Enter to continue...')
+                _pause()
                 continue
-            sel = input('Enter project number to download (or ENTER to return): ').strip()
+            sel = input('Enter project number(s) to download, e.g. 2 or 1,3 (or ENTER to return): ').strip()
             if not sel:
                 continue
             try:
-                idx = int(sel) - 1
-                if idx < 0 or idx >= len(projects):
-                    print(style_red('Invalid selection.'))
+                # the same project twice would only race itself for the target file
+                picks = list(dict.fromkeys(int(x) - 1 for x in sel.replace(',', ' ').split()))
+                if not picks or any(idx < 0 or idx >= len(projects) for idx in picks):
+                    print(_RED_INVALID_SEL)
                     time.sleep(1)
                     continue
             except ValueError:
-                print(style_red('Enter a valid number.'))
+                print(_RED_ENTER_NUM)
                 time.sleep(1)
                 continue
-            project = projects[idx]
             use_default = input('Download to default path from settings? (Y/n): ').strip().lower()
             if use_default in ('', 'y', 'yes'):
                 custom = None
@@ -750,19 +1282,20 @@ def interactive_menu() -> None:
                     custom = None
             dry = input('Dry-run? (shows actions but does not download) (y/N): ').strip().lower()
             dry_run = (dry == 'y')
-            ok = download_project_item(project, cfg, custom_path=custom, dry_run=dry_run)
+            if len(picks) == 1:
+                ok = download_project_item(projects[picks[0]], cfg, custom_path=custom, dry_run=dry_run)
+            else:
+                results = download_projects([projects[idx] for idx in picks], cfg, custom_path=custom, dry_run=dry_run)
+                for idx, res in zip(picks, results):
+                    print(f"{projects[idx].get('name')}: {'OK' if res else 'FAILED'}")
+                ok = all(results)
             if ok:
-                print(style_green('Download completed successfully.'))
+                print(_GREEN_DOWNLOAD_OK)
             else:
-                print(style_red('Download failed.'))
-            input('Press Enter to continue...')
+                print(_RED_DOWNLOAD_FAILED)
+            _pause()
         elif choice == '2':
-            print(style_bold('\nManage Projects:'))
-            print('1) Add')
-            print('2) Edit')
-            print('3) Delete')
-            print('4) Search')
-            print('0) Back')
+            print(_MANAGE_MENU)
             c = input('Choose: ').strip()
             if c == '1':
                 add_project(cfg)
@@ -774,20 +1307,20 @@ def interactive_menu() -> None:
                 search_projects(cfg)
             else:
                 pass
-            input('Press Enter to continue...')
+            _pause()
         elif choice == '3':
             settings_menu(cfg)
         elif choice == '4':
             print('Validating links...')
             validate_all_links(cfg, detailed=True)
-            input('Press Enter to continue...')
+            _pause()
         elif choice == '5':
             sync_from_central(cfg)
-            input('Press Enter to continue...')
+            _pause()
         elif choice == '6':
             out = input('Enter CSV path (default: downloads_audit.csv): ').strip() or 'downloads_audit.csv'
             export_audit_csv(Path(out))
-            input('Press Enter to continue...')
+            _pause()
         elif choice == '7':
             print('Starting daemon (CTRL+C to stop)...')
             run_daemon(cfg)
@@ -795,10 +1328,64 @@ def interactive_menu() -> None:
             print('Goodbye.')
             break
         else:
-            print(style_red('Unknown selection.'))
+            print(_RED_UNKNOWN)
             time.sleep(1)
 
 
+def _edit_download_path(cfg: Dict) -> None:
+    new = input('Enter new download path: ').strip()
+    if new:
+        cfg['download_path'] = new
+        print(style_green('Download path updated.'))
+
+
+def _edit_source(cfg: Dict) -> None:
+    new = input('Choose source (local/remote): ').strip()
+    if new in ('local', 'remote'):
+        cfg['source'] = new
+        if new == 'remote':
+            url = input('Enter full projects.json URL: ').strip()
+            cfg['projects_url'] = url
+        else:
+            filep = input(f'Enter local projects file path [{cfg.get("projects_file")}]: ').strip()
+            if filep:
+                cfg['projects_file'] = filep
+
+
+def _edit_int_setting(cfg: Dict, key: str, prompt: str) -> None:
+    new = input(prompt).strip()
+    # optional sign, then digits int() accepts (isdigit() would also pass e.g. '²')
+    if not (new[1:] if new[:1] in '+-' else new).isdecimal():
+        print(_RED_INVALID_NUM)
+        return
+    cfg[key] = int(new)
+
+
+def _edit_str_setting(cfg: Dict, key: str, prompt: str) -> None:
+    cfg[key] = input(prompt).strip()
+
+
+def _edit_connection_setting(cfg: Dict, key: str, prompt: str) -> None:
+    _edit_str_setting(cfg, key, prompt)
+    # drop openers built for the old proxy/token (they also hold the old token)
+    _opener_for.cache_clear()
+
+
+# settings_menu choice -> handler; choices in _LOCKED_SETTINGS are refused in production mode
+_SETTINGS_HANDLERS: Dict[str, Callable[[Dict], None]] = {
+    '1': _edit_download_path,
+    '2': _edit_source,
+    '3': functools.partial(_edit_int_setting, key='parallel', prompt='Parallel downloads (number): '),
+    '4': functools.partial(_edit_int_setting, key='bandwidth_limit', prompt='Bandwidth limit (bytes/sec, 0=unlimited): '),
+    '5': functools.partial(_edit_connection_setting, key='proxy', prompt='Proxy (e.g. http://127.0.0.1:8080) or empty to unset: '),
+    '6': functools.partial(_edit_connection_setting, key='github_token', prompt='GitHub token (stored in config): '),
+    '7': functools.partial(_edit_int_setting, key='validate_cache_ttl', prompt='Validate cache TTL seconds: '),
+    '8': functools.partial(_edit_int_setting, key='daemon_poll_interval', prompt='Daemon poll interval seconds: '),
+    '9': functools.partial(_edit_str_setting, key='webhook_on_event', prompt='Webhook URL for events (empty to unset): '),
+}
+_LOCKED_SETTINGS = frozenset({'2'})
+
+
 def settings_menu(cfg: Dict) -> None:
     if cfg.get('locked'):
         print(style_red('Production mode enabled. Advanced settings are locked.'))
@@ -818,83 +1405,65 @@ def settings_menu(cfg: Dict) -> None:
         if choice == '0':
             save_config(cfg)
             return
-        if cfg.get('locked') and choice in ('2',):
-            print(style_red('This option is locked in production mode.'))
+        handler = _SETTINGS_HANDLERS.get(choice)
+        if handler is None:
+            print(_RED_UNKNOWN_OPTION)
             continue
-        if choice == '1':
-            new = input('Enter new download path: ').strip()
-            if new:
-                cfg['download_path'] = new
-                print(style_green('Download path updated.'))
-        elif choice == '2':
-            new = input('Choose source (local/remote): ').strip()
-            if new in ('local', 'remote'):
-                cfg['source'] = new
-                if new == 'remote':
-                    url = input('Enter full projects.json URL: ').strip()
-                    cfg['projects_url'] = url
-                else:
-                    filep = input(f'Enter local projects file path [{cfg.get("projects_file")}]: ').strip()
-                    if filep:
-                        cfg['projects_file'] = filep
-        elif choice == '3':
-            new = input('Parallel downloads (number): ').strip()
-            try:
-                cfg['parallel'] = int(new)
-            except Exception:
-                print(style_red('Invalid number.'))
-        elif choice == '4':
-            new = input('Bandwidth limit (bytes/sec, 0=unlimited): ').strip()
-            try:
-                cfg['bandwidth_limit'] = int(new)
-            except Exception:
-                print(style_red('Invalid number.'))
-        elif choice == '5':
-            new = input('Proxy (e.g. http://127.0.0.1:8080) or empty to unset: ').strip()
-            cfg['proxy'] = new
-        elif choice == '6':
-            new = input('GitHub token (stored in config): ').strip()
-            cfg['github_token'] = new
-        elif choice == '7':
-            new = input('Validate cache TTL seconds: ').strip()
-            try:
-                cfg['validate_cache_ttl'] = int(new)
-            except Exception:
-                print(style_red('Invalid number.'))
-        elif choice == '8':
-            new = input('Daemon poll interval seconds: ').strip()
-            try:
-                cfg['daemon_poll_interval'] = int(new)
-            except Exception:
-                print(style_red('Invalid number.'))
-        elif choice == '9':
-            new = input('Webhook URL for events (empty to unset): ').strip()
-            cfg['webhook_on_event'] = new
-        else:
-            print(style_red('Unknown option.'))
+        if cfg.get('locked') and choice in _LOCKED_SETTINGS:
+            print(_RED_LOCKED)
+            continue
+        handler(cfg)
 
 
-def sync_from_central(cfg: Dict) -> None:
+# central URL -> {'If-None-Match': etag, 'If-Modified-Since': date} from its last merged response
+_CENTRAL_VALIDATORS: Dict[str, Dict[str, str]] = {}
+
+
+def sync_from_central(cfg: Dict, conditional: bool = False) -> None:
+    """Merge new projects from the central list. With conditional=True (daemon polls) the request
+    carries the validators of the last merged response, and a 304 skips decoding and merging."""
+    import urllib.error
+    import urllib.request
     central = cfg.get('central_url')
     if not central:
         print(style_red('Central URL not configured in settings.'))
         return
+    headers = _CENTRAL_VALIDATORS.get(central, {}) if conditional else {}
     try:
         opener = make_opener(cfg)
-        with opener.open(central, timeout=15) as r:
-            data = json.loads(r.read().decode('utf-8'))
+        with opener.open(urllib.request.Request(central, headers=headers), timeout=15) as r:
+            # parse the raw bytes: no decoded str copy of the payload is held alongside it
+            data = _json_loads(r.read())
             if not isinstance(data, list):
                 print(style_red('Central data is not a list of projects.'))
                 return
+            validators = {}
+            if r.headers.get('ETag'):
+                validators['If-None-Match'] = r.headers['ETag']
+            if r.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = r.headers['Last-Modified']
             local = load_projects(cfg)
-            local_urls = {p.get('url') for p in local}
+            local_urls = {u for u in (p.get('url') for p in local) if u}
             added = 0
             for item in data:
-                if item.get('url') not in local_urls:
-                    local.append(item)
-                    added += 1
-            save_local_projects(cfg, local)
-            print(style_green(f'Sync complete. Added {added} projects.'))
+                url = item.get('url')
+                # items without a URL are never merged; accepted URLs are tracked so central duplicates merge once
+                if not url or url in local_urls:
+                    continue
+                local.append(item)
+                local_urls.add(url)
+                added += 1
+            if added:
+                save_local_projects(cfg, local)
+                print(style_green(f'Sync complete. Added {added} projects.'))
+            else:
+                print(style_green('Sync complete. No new projects.'))
+            _CENTRAL_VALIDATORS[central] = validators
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print(style_green('Sync complete. Central list unchanged.'))
+        else:
+            print(style_red(f'Sync failed: {e}'))
     except Exception as e:
         print(style_red(f'Sync failed: {e}'))
 
@@ -910,7 +1479,18 @@ def get_project_cli(cfg: Dict, idx: int, custom_path: Optional[str] = None, dry_
     if idx <= 0 or idx > len(projects):
         print(style_red('Project number out of range.'))
         return
-    project = projects[idx - 1]
+    _download_cli(cfg, projects[idx - 1], custom_path, dry_run)
+
+
+def get_project_by_name_cli(cfg: Dict, name: str, custom_path: Optional[str] = None, dry_run: bool = False) -> None:
+    project = find_project_by_name(cfg, name)
+    if project is None:
+        print(style_red(f'No project named {name!r}.'))
+        return
+    _download_cli(cfg, project, custom_path, dry_run)
+
+
+def _download_cli(cfg: Dict, project: Dict, custom_path: Optional[str], dry_run: bool) -> None:
     ok = download_project_item(project, cfg, custom_path=custom_path, dry_run=dry_run)
     if ok:
         print(style_green('Download succeeded.'))
@@ -929,52 +1509,52 @@ def add_project_cli(cfg: Dict, name: str, url: str, sha: Optional[str] = None) -
 
 # ------------------------- Entry point & arg parsing -------------------------
 
-def print_usage() -> None:
-    print('Usage: python project_cli.py [--list] [--get N] [--add "Name" "URL" [sha256]] [--sync] [--daemon] [--dry-run] [--export-log path]')
+def build_arg_parser() -> 'argparse.ArgumentParser':
+    import argparse
+    parser = argparse.ArgumentParser(prog='project-cli.py', description='Projects Downloader by Xeo Studio. Run without arguments for the interactive menu.')
+    parser.add_argument('--list', action='store_true', help='list projects with their validation status')
+    parser.add_argument('--get', type=int, metavar='N', help='download project number N')
+    parser.add_argument('--get-name', metavar='NAME', help='download the project named NAME')
+    parser.add_argument('--path', metavar='DIR', help='with --get/--get-name: download into DIR instead of the configured download path')
+    parser.add_argument('--dry-run', action='store_true', help='with --get/--get-name: show what would be downloaded without downloading')
+    parser.add_argument('--add', nargs='+', metavar='ARG', help='add a project: --add "Name" "URL" [sha256]')
+    parser.add_argument('--sync', action='store_true', help='merge new projects from the central URL')
+    parser.add_argument('--daemon', action='store_true', help='keep polling the central URL for updates')
+    parser.add_argument('--export-log', metavar='PATH', help='export the download log as CSV')
+    return parser
 
 
 def main() -> None:
-    cfg = load_config()
     args = sys.argv[1:]
     if not args:
         interactive_menu()
         return
-    if '--help' in args or '-h' in args:
-        print_usage()
-        return
-    if '--list' in args:
+    # parse first: --help and usage errors exit here without reading the config
+    ns, _ = build_arg_parser().parse_known_args(args)
+    cfg = load_config()
+    if ns.list:
         list_projects_cli(cfg)
         return
-    if '--get' in args:
-        try:
-            i = args.index('--get')
-            n = int(args[i + 1])
-        except Exception:
-            print('Use --get N where N is project number.')
-            return
-    if '--add' in args:
-        try:
-            i = args.index('--add')
-            name = args[i + 1]
-            url = args[i + 2]
-            sha = args[i + 3] if len(args) > i + 3 else None
-            add_project_cli(cfg, name, url, sha)
-        except Exception:
+    if ns.get is not None:
+        get_project_cli(cfg, ns.get, custom_path=ns.path, dry_run=ns.dry_run)
+        return
+    if ns.get_name is not None:
+        get_project_by_name_cli(cfg, ns.get_name, custom_path=ns.path, dry_run=ns.dry_run)
+        return
+    if ns.add is not None:
+        if not 2 <= len(ns.add) <= 3:
             print('Usage: --add "Name" "URL" [sha256]')
+            return
+        add_project_cli(cfg, *ns.add)
         return
-    if '--sync' in args:
+    if ns.sync:
         sync_from_central(cfg)
         return
-    if '--daemon' in args:
+    if ns.daemon:
         run_daemon(cfg)
         return
-    if '--export-log' in args:
-        try:
-            i = args.index('--export-log')
-            out = args[i + 1]
-            export_audit_csv(Path(out))
-        except Exception:
-            print('Usage: --export-log <path>')
+    if ns.export_log is not None:
+        export_audit_csv(Path(ns.export_log))
         return
     print('Unknown arguments. Entering interactive mode...')
     interactive_menu()